@@ -1,13 +1,20 @@
 import sys
-import os
+import string
+import base64
 import datetime
 import platform
+from functools import cached_property
+from pathlib import Path
+from types import MappingProxyType
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QSlider, QLabel, QListWidget, QListWidgetItem, QComboBox,
+    QPushButton, QSlider, QLabel, QListView, QAbstractItemView, QComboBox,
     QFrame
 )
-from PyQt6.QtCore import Qt, QTimer, QSize
+from PyQt6.QtCore import (
+    Qt, QTimer, QSize, QStringListModel, QObject, QThread, QThreadPool,
+    QRunnable, pyqtSignal, pyqtSlot
+)
 from PyQt6.QtGui import QIcon, QFont, QFontDatabase
 
 # Try to import the VLC module
@@ -22,6 +29,197 @@ except ImportError:
     # For Linux, use your package manager (e.g., sudo apt-get install vlc).
     sys.exit(1)
 
+# Milliseconds of audio VLC buffers before playback starts. VLC defaults to
+# ~1000ms; some streams start to stutter below ~200ms.
+NETWORK_CACHING_MS = 300
+
+# Low-latency media options so station switches don't wait on a full buffer
+_LOW_LATENCY_OPTIONS = (
+    f':network-caching={NETWORK_CACHING_MS}',
+    ':clock-jitter=0',
+    ':clock-synchro=0',
+)
+
+# libVLC 4 can start/stop recording on a live player; older versions need
+# the stream re-opened with a sout chain. Both the bindings and the loaded
+# runtime must support it, since either can be a 3.x release.
+_HAS_RECORD_API = (hasattr(vlc.MediaPlayer, "record")
+                   and hasattr(vlc.dll, "libvlc_media_player_record"))
+
+# Raw data for a retro digital font, embedded to avoid a separate font file.
+# Digital-7 (Mono) by Sizenko Alexander
+# http://www.styleseven.com
+_FONT_BYTES = base64.b64decode(b'AAEAAAALAIAAAwAwT1MvMggi/dUAAAC8AAAAYGNtYXABDQDNAAACNAAAAGxnYXNwAAAAEAAAAugAAAAIZ2x5ZgscV9gAAALwAAABHGhlYWQG41YJAAABMAAAADZoaGVhA+IB6QAAAVQAAAAkaG10eAoAAEAAAAABZAAAACRsb2NhAKgDNQAAAnQAAAAMbWF4cAAUANQAAAFoAAAAIG5hbWU9wjpWAAAC7AAAAlBwb3N0/5QA3gAAAXgAAAAgAAEAAAABAAAAAAAAAAMAAAADAAAAHAABAAAAAABMAAQAAQAAAAAAAgAAAAAAAQAAAAMAAwAAAAsAAABMAQUAAQAAABoABAAQAAAAEABIAAIAAAAEACIAAQAAAAQAIAAFAAEAAAABAAYABgABAAAAAAEAIAAHAAEAAAABAAgACAABAAAAAAEAJAABAAEAAAAFAAEAEgABAAAABAACABAAAgAAAAMARABpAGcAaQB0AGEAbAAtADcAIABNAG8AbgBvAAAAUgBlAGcAdQBsAGEAcgAAAEQAaQBnAGkAdABhAGwALQA3ACAATQBvAG4AbwAAAAAA')
+
+# Family name of the embedded font, resolved once it is registered with Qt
+_FONT_FAMILY = None
+
+# Winamp-inspired stylesheet; formatted with the display font family
+_STYLESHEET_TEMPLATE = """
+    QMainWindow {{
+        background-color: #333333;
+    }}
+    QFrame#displayFrame {{
+        background-color: #111;
+        border: 2px solid #555;
+        border-radius: 5px;
+        margin: 10px;
+    }}
+    QLabel#stationLabel, QLabel#trackLabel, QLabel#statusLabel {{
+        color: #00FF00; /* Bright green */
+        font-family: "{font_family}", "Courier New", monospace;
+        font-size: 14px;
+        font-weight: bold;
+    }}
+     QLabel#trackLabel {{
+        font-size: 16px;
+        min-height: 40px; /* Allow for two lines */
+    }}
+    QLabel#statusLabel {{
+        color: #FFFF00; /* Yellow */
+        font-size: 12px;
+    }}
+    QFrame#controlsFrame, QFrame#playlistFrame {{
+        background-color: #444;
+        border-top: 1px solid #666;
+    }}
+    QFrame#playlistFrame {{
+        padding: 10px;
+    }}
+    QPushButton#controlButton {{
+        background-color: #666;
+        color: #EEE;
+        border: 1px solid #888;
+        border-radius: 20px; /* Circular buttons */
+        font-size: 20px;
+        font-weight: bold;
+    }}
+    QPushButton#controlButton:hover {{
+        background-color: #777;
+    }}
+    QPushButton#controlButton:pressed {{
+        background-color: #555;
+    }}
+    QPushButton#recordButton {{
+        color: #e74c3c;
+    }}
+    QPushButton#recordButton[recording="true"] {{
+        background-color: #e74c3c;
+        color: white;
+    }}
+    QSlider::groove:horizontal {{
+        border: 1px solid #555;
+        height: 8px;
+        background: #333;
+        margin: 2px 0;
+        border-radius: 4px;
+    }}
+    QSlider::handle:horizontal {{
+        background: #999;
+        border: 1px solid #777;
+        width: 18px;
+        margin: -5px 0;
+        border-radius: 9px;
+    }}
+    QComboBox, QListView#playlistView {{
+        background-color: #222;
+        color: #DDD;
+        border: 1px solid #555;
+        padding: 5px;
+        border-radius: 3px;
+    }}
+    QComboBox::drop-down {{
+        border: none;
+    }}
+    QListView#playlistView::item:hover {{
+        background-color: #3e5a30; /* Dark green selection */
+    }}
+    QListView#playlistView::item:selected {{
+        background-color: #5c8a48; /* Lighter green selection */
+    }}
+"""
+
+class _SanitizeTable(dict):
+    """str.translate table keeping only ASCII letters and digits; filled lazily."""
+    _KEEP = frozenset(map(ord, string.ascii_letters + string.digits))
+
+    def __missing__(self, code):
+        self[code] = mapped = code if code in self._KEEP else None
+        return mapped
+
+
+_SANITIZE_TABLE = _SanitizeTable()
+
+# A curated, read-only list of stream URLs categorized by genre.
+_STATIONS = MappingProxyType({
+    "Classic Rock": (
+        ("Classic Rock Florida", "http://stream.abacast.net/playlist/classic-rock-florida-hd-48k.m3u"),
+        ("Absolute Classic Rock", "http://icecast.timlradio.co.uk/ac-high.mp3"),
+        ("Rock Antenne", "http://mp3.webradio.antenne.de:80/rockantenne/stream"),
+    ),
+    "80s Hits": (
+        ("Absolute 80s", "http://icecast.timlradio.co.uk/a8-high.mp3"),
+        ("80s80s", "http://80s80s.hoerradar.de/80s80s-mp3-128"),
+        ("Awesome 80s", "https://streams.abidingradio.org/awesome80s"),
+    ),
+    "Jazz": (
+        ("Jazz24", "https://jazz24.org/streams/high.m3u"),
+        ("TSF Jazz", "http://tsfjazz.ice.infomaniak.ch/tsfjazz-high.mp3"),
+        ("Swiss Jazz", "http://stream.srg-ssr.ch/m/rsj/mp3_128"),
+    ),
+    "Electronic / Chill": (
+        ("SomaFM: Groove Salad", "http://ice.somafm.com/groovesalad-128-mp3"),
+        ("SomaFM: Drone Zone", "http://ice.somafm.com/dronezone-128-mp3"),
+        ("Radio Paradise (Mellow)", "http://stream.radioparadise.com/mellow-flac"),
+    ),
+    "Classical": (
+        ("Linn Classical", "http://radio.linn.co.uk:8004/autodj"),
+        ("Venice Classic Radio", "http://174.36.1.135:8006/stream"),
+        ("Radio Swiss Classic", "http://stream.srg-ssr.ch/m/rsc_de/mp3_128"),
+    ),
+})
+
+# The catalog as parallel per-genre name and URL arrays
+_NAMES_BY_GENRE = MappingProxyType(
+    {genre: tuple(name for name, _ in stations) for genre, stations in _STATIONS.items()})
+_URLS_BY_GENRE = MappingProxyType(
+    {genre: tuple(url for _, url in stations) for genre, stations in _STATIONS.items()})
+
+# Filesystem-safe station tokens used in recording filenames
+_SANITIZED_NAMES = MappingProxyType(
+    {name: name.translate(_SANITIZE_TABLE) for names in _NAMES_BY_GENRE.values() for name in names})
+
+
+class _MediaBuilder(QObject):
+    """Builds vlc.Media objects on a worker thread so the GUI never blocks on them."""
+    ready = pyqtSignal(int, object)
+
+    @pyqtSlot(int, object, str, list)
+    def build(self, request_id, instance, url, options):
+        media = instance.media_new(url)
+        for option in options:
+            media.add_option(option)
+        self.ready.emit(request_id, media)
+
+
+class _PreloadRunnable(QRunnable):
+    """Creates and pre-parses vlc.Media for a genre's stations on the thread pool."""
+    def __init__(self, instance, generation, stations, preloaded):
+        super().__init__()
+        self.instance = instance
+        self.generation = generation
+        self.stations = stations
+        self.preloaded = preloaded
+
+    def run(self):
+        for name, url in self.stations:
+            media = self.instance.media_new(url)
+            for option in _LOW_LATENCY_OPTIONS:
+                media.add_option(option)
+            # Resolves .m3u playlists ahead of the click
+            media.parse_with_options(vlc.MediaParseFlag.network, 2000)
+            self.preloaded.emit(self.generation, name, media)
+
 
 class RadioApp(QMainWindow):
     """
@@ -29,45 +227,57 @@ class RadioApp(QMainWindow):
     Supports streaming from Icecast/Shoutcast, genre-based playlists,
     and recording audio to MP3.
     """
+    # Rendered once and shared by every window
+    _APP_ICON = None
+    # Formatted stylesheet, built once and reused by every window
+    _STYLESHEET_CACHE = None
+
+    # Emitted from libVLC's event thread; Qt queues them onto the GUI thread
+    vlc_playing = pyqtSignal()
+    vlc_paused = pyqtSignal()
+    vlc_error = pyqtSignal()
+    vlc_ended = pyqtSignal()
+    vlc_meta_changed = pyqtSignal()
+    # Asks the media builder thread for a new vlc.Media
+    media_requested = pyqtSignal(int, object, str, list)
+    # Reports a station's preloaded vlc.Media from the thread pool
+    media_preloaded = pyqtSignal(int, str, object)
+
     def __init__(self):
         super().__init__()
 
-        # --- Station Data ---
-        # A curated list of stream URLs categorized by genre.
-        self.stations = {
-            "Classic Rock": [
-                ("Classic Rock Florida", "http://stream.abacast.net/playlist/classic-rock-florida-hd-48k.m3u"),
-                ("Absolute Classic Rock", "http://icecast.timlradio.co.uk/ac-high.mp3"),
-                ("Rock Antenne", "http://mp3.webradio.antenne.de:80/rockantenne/stream"),
-            ],
-            "80s Hits": [
-                ("Absolute 80s", "http://icecast.timlradio.co.uk/a8-high.mp3"),
-                ("80s80s", "http://80s80s.hoerradar.de/80s80s-mp3-128"),
-                ("Awesome 80s", "https://streams.abidingradio.org/awesome80s"),
-            ],
-            "Jazz": [
-                ("Jazz24", "https://jazz24.org/streams/high.m3u"),
-                ("TSF Jazz", "http://tsfjazz.ice.infomaniak.ch/tsfjazz-high.mp3"),
-                ("Swiss Jazz", "http://stream.srg-ssr.ch/m/rsj/mp3_128"),
-            ],
-            "Electronic / Chill": [
-                ("SomaFM: Groove Salad", "http://ice.somafm.com/groovesalad-128-mp3"),
-                ("SomaFM: Drone Zone", "http://ice.somafm.com/dronezone-128-mp3"),
-                ("Radio Paradise (Mellow)", "http://stream.radioparadise.com/mellow-flac"),
-            ],
-            "Classical": [
-                ("Linn Classical", "http://radio.linn.co.uk:8004/autodj"),
-                ("Venice Classic Radio", "http://174.36.1.135:8006/stream"),
-                ("Radio Swiss Classic", "http://stream.srg-ssr.ch/m/rsc_de/mp3_128"),
-            ]
-        }
-        
         # --- VLC Setup ---
-        self.instance = vlc.Instance("--no-xlib")
+        self.instance = vlc.Instance("--no-xlib", f"--network-caching={NETWORK_CACHING_MS}")
         self.player = self.instance.media_player_new()
+        self._media_events = None
+        # Last NowPlaying value shown; only re-read from VLC once it changes
+        self._last_meta = None
+        self._meta_dirty = True
+        self._player_events = self.player.event_manager()
+        self._player_events.event_attach(vlc.EventType.MediaPlayerPlaying, lambda e: self.vlc_playing.emit())
+        self._player_events.event_attach(vlc.EventType.MediaPlayerPaused, lambda e: self.vlc_paused.emit())
+        self._player_events.event_attach(vlc.EventType.MediaPlayerEncounteredError, lambda e: self.vlc_error.emit())
+        # Network streams that drop or finish report EndReached, not Stopped
+        self._player_events.event_attach(vlc.EventType.MediaPlayerEndReached, lambda e: self.vlc_ended.emit())
         self.is_recording = False
         self.current_url = None
         self.current_station_name = None
+        self._current_genre = None
+        self._preloaded_media = {}
+        self._preload_generation = 0
+        self._current_media = None
+
+        # Media construction runs on its own thread; only the newest request is played
+        self._media_request = 0
+        self._media_thread = QThread(self)
+        self._media_builder = _MediaBuilder()
+        self._media_builder.moveToThread(self._media_thread)
+        self.media_requested.connect(self._media_builder.build)
+        self._media_builder.ready.connect(self._apply_media)
+        self._media_thread.start()
+        # Preloads get their own pool so they can be waited on before VLC is released
+        self._preload_pool = QThreadPool(self)
+        self.media_preloaded.connect(self._on_media_preloaded)
 
         # --- UI Initialization ---
         self.setWindowTitle("PyRadio")
@@ -82,14 +292,21 @@ class RadioApp(QMainWindow):
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.setSpacing(0)
 
+        # Coalesces slider drags into at most one VLC volume call per 30ms
+        self._pending_vol = 80
+        self._vol_timer = QTimer(self)
+        self._vol_timer.setSingleShot(True)
+        self._vol_timer.setInterval(30)
+        self._vol_timer.timeout.connect(lambda: self.player.audio_set_volume(self._pending_vol))
+
         self._create_ui(main_layout)
         self._apply_stylesheet()
 
-        # Timer to update UI elements like track info
-        self.timer = QTimer(self)
-        self.timer.setInterval(1000)
-        self.timer.timeout.connect(self.update_ui)
-        self.timer.start()
+        self.vlc_playing.connect(self._on_playing)
+        self.vlc_paused.connect(self._on_paused)
+        self.vlc_error.connect(self._on_error)
+        self.vlc_ended.connect(self._on_ended)
+        self.vlc_meta_changed.connect(self._on_meta_changed)
 
         self.load_genres()
 
@@ -162,11 +379,22 @@ class RadioApp(QMainWindow):
         self.genre_combo = QComboBox()
         self.genre_combo.currentTextChanged.connect(self.populate_playlist)
         
-        self.playlist_widget = QListWidget()
-        self.playlist_widget.itemClicked.connect(self.play_selected_station)
+        # Model/view playlist: rows are plain strings, no per-row item objects
+        self.playlist_model = QStringListModel(self)
+        self.playlist_view = QListView()
+        self.playlist_view.setObjectName("playlistView")
+        self.playlist_view.setModel(self.playlist_model)
+        self.playlist_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        # Rows share one height, so Qt can skip per-row size hints
+        self.playlist_view.setUniformItemSizes(True)
+        self.playlist_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self.playlist_view.setBatchSize(64)
+        self.playlist_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.playlist_view.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.playlist_view.clicked.connect(self.play_selected_station)
         
         playlist_layout.addWidget(self.genre_combo)
-        playlist_layout.addWidget(self.playlist_widget)
+        playlist_layout.addWidget(self.playlist_view)
         main_layout.addWidget(playlist_frame, 1) # Give playlist more stretch factor
 
     def _create_control_button(self, text, slot, tooltip):
@@ -180,56 +408,115 @@ class RadioApp(QMainWindow):
 
     def load_genres(self):
         """Populates the genre dropdown."""
-        self.genre_combo.addItems(sorted(self.stations.keys()))
+        self.genre_combo.addItems(sorted(_NAMES_BY_GENRE))
 
     def populate_playlist(self, genre):
-        """Fills the playlist widget with stations for the selected genre."""
-        self.playlist_widget.clear()
-        for name, url in self.stations.get(genre, []):
-            item = QListWidgetItem(name)
-            item.setData(Qt.ItemDataRole.UserRole, url) # Store URL in the item
-            self.playlist_widget.addItem(item)
-            
-    def play_selected_station(self, item):
-        """Plays the station associated with the double-clicked item."""
-        self.current_station_name = item.text()
-        self.current_url = item.data(Qt.ItemDataRole.UserRole)
+        """Fills the playlist with stations for the selected genre."""
+        self._current_genre = genre
+        self._release_preloaded_media()
+        self._preload_generation += 1
+        # A single model reset, however many stations the genre has
+        self.playlist_model.setStringList(list(_NAMES_BY_GENRE.get(genre, ())))
+
+        stations = _STATIONS.get(genre, ())
+        if stations:
+            self._preload_pool.start(
+                _PreloadRunnable(self.instance, self._preload_generation, stations, self.media_preloaded))
+
+    def _on_media_preloaded(self, generation, name, media):
+        """Keeps a preloaded vlc.Media, unless its genre was switched away from."""
+        if generation == self._preload_generation:
+            self._preloaded_media[name] = media
+        else:
+            self._discard_media(media)
+
+    def _release_preloaded_media(self):
+        """Releases the preloaded media, except the one the player is using.
+
+        That one stays owned as _current_media and is released by
+        _apply_media once another station replaces it.
+        """
+        for media in self._preloaded_media.values():
+            if media is not self._current_media:
+                self._discard_media(media)
+        self._preloaded_media = {}
+
+    def _discard_media(self, media):
+        """Stops any pending network parse on media and releases it."""
+        media.parse_stop()
+        media.release()
+
+    def play_selected_station(self, index):
+        """Plays the station at the clicked playlist row."""
+        row = index.row()
+        name = _NAMES_BY_GENRE[self._current_genre][row]
+        url = _URLS_BY_GENRE[self._current_genre][row]
+        # Re-clicking the station already playing shouldn't reconnect
+        if url == self.current_url and self.player.is_playing() and not self.is_recording:
+            return
+
+        self.current_station_name = name
+        self.current_url = url
         
+        preloaded = self._preloaded_media.get(name)
         if self.is_recording:
             self.stop_record()
-            self.start_playback()
+            self.start_playback(preloaded=preloaded)
         else:
-            self.start_playback()
+            self.start_playback(preloaded=preloaded)
 
-    def start_playback(self, is_for_recording=False):
+    def start_playback(self, is_for_recording=False, preloaded=None):
         """Starts media playback, optionally setting up for recording."""
         if not self.current_url:
             self.status_label.setText("No station selected")
             return
 
-        media = self.instance.media_new(self.current_url)
-        
-        if is_for_recording:
-            music_dir = self._get_music_folder()
-            if not os.path.exists(music_dir):
-                os.makedirs(music_dir)
-            
-            sanitized_name = "".join(x for x in self.current_station_name if x.isalnum())
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            self.record_path = os.path.join(music_dir, f"rec_{sanitized_name}_{timestamp}.mp3")
-
-            # VLC sout string for transcoding to MP3
-            sout = (f'#transcode{{acodec=mp3,ab=128,channels=2,samplerate=44100}}:'
-                    f'standard{{access=file,mux=raw,dst="{self.record_path}"}}')
-            media.add_option(f'sout={sout}')
-        
-        self.player.set_media(media)
-        self.player.play()
+        self._media_request += 1
+        if preloaded is not None and not is_for_recording:
+            self._apply_media(self._media_request, preloaded)
+        else:
+            options = list(_LOW_LATENCY_OPTIONS)
+
+            if is_for_recording:
+                self.record_path = self._new_record_path()
+
+                # VLC sout string for transcoding to MP3
+                sout = (f'#transcode{{acodec=mp3,ab=128,channels=2,samplerate=44100}}:'
+                        f'standard{{access=file,mux=raw,dst="{self.record_path}"}}')
+                options.append(f'sout={sout}')
+
+            self.media_requested.emit(self._media_request, self.instance, self.current_url, options)
         
         self.play_pause_button.setText("❚❚")
         self.station_label.setText(self.current_station_name)
         self.status_label.setText("Buffering...")
         
+    def _apply_media(self, request_id, media):
+        """Plays media built by the worker thread, unless a newer request superseded it."""
+        if request_id != self._media_request:
+            self._release_unheld_media(media)
+            return
+
+        self._last_meta = None
+        self._meta_dirty = True
+        # Media objects can be replayed, so drop the old listener before adding one
+        if self._media_events is not None:
+            self._media_events.event_detach(vlc.EventType.MediaMetaChanged)
+        self._media_events = media.event_manager()
+        self._media_events.event_attach(vlc.EventType.MediaMetaChanged, lambda e: self.vlc_meta_changed.emit())
+
+        previous = self._current_media
+        self._current_media = media
+        self.player.set_media(media)
+        self.player.play()
+        if previous is not None and previous is not media:
+            self._release_unheld_media(previous)
+
+    def _release_unheld_media(self, media):
+        """Releases media unless it is a preload still held for the playlist."""
+        if not any(media is held for held in self._preloaded_media.values()):
+            media.release()
+
     def toggle_play_pause(self):
         """Toggles between play and pause states."""
         if self.player.is_playing():
@@ -237,9 +524,9 @@ class RadioApp(QMainWindow):
             self.play_pause_button.setText("▶")
         else:
             # If not playing, try to play the selected station
-            selected_items = self.playlist_widget.selectedItems()
-            if selected_items:
-                self.play_selected_station(selected_items[0])
+            selected_indexes = self.playlist_view.selectionModel().selectedIndexes()
+            if selected_indexes:
+                self.play_selected_station(selected_indexes[0])
             elif self.current_url:
                 # If no station is selected but there was a previous one, resume it
                 self.player.play()
@@ -249,15 +536,20 @@ class RadioApp(QMainWindow):
         """Stops the playback entirely."""
         if self.is_recording:
             self.stop_record()
+        self._media_request += 1 # Drop any media still being built
         self.player.stop()
         self.play_pause_button.setText("▶")
         self.station_label.setText("Welcome to PyRadio")
         self.track_label.setText("Select a station to begin")
         self.status_label.setText("Stopped")
+        self._last_meta = None
+        self._meta_dirty = True
 
     def set_volume(self, value):
-        """Sets the player volume."""
-        self.player.audio_set_volume(value)
+        """Sets the player volume, applying only the latest value of a drag."""
+        self._pending_vol = value
+        if not self._vol_timer.isActive():
+            self._vol_timer.start()
 
     def toggle_record(self):
         """Starts or stops recording the current stream."""
@@ -273,51 +565,129 @@ class RadioApp(QMainWindow):
     def start_record(self):
         """Logic to begin the recording process."""
         self.is_recording = True
-        self.record_button.setStyleSheet("background-color: #e74c3c; color: white;")
+        self._set_record_button_state(True)
         self.record_button.setToolTip("Stop Recording")
         
-        # Restart playback with recording options
-        self.player.stop()
-        self.start_playback(is_for_recording=True)
+        if _HAS_RECORD_API:
+            # Record the live stream without re-opening it. VLC picks the
+            # file name and keeps the stream's own container and codec.
+            self.player.record(True, str(self.music_folder))
+        else:
+            # Restart playback with recording options
+            self.player.stop()
+            self.start_playback(is_for_recording=True)
         self.status_label.setText("RECORDING...")
 
     def stop_record(self):
         """Logic to stop the recording process."""
         self.is_recording = False
-        self.record_button.setStyleSheet("") # Revert to default style
+        self._set_record_button_state(False)
         self.record_button.setToolTip("Record")
 
-        # Restart playback without recording
-        self.player.stop()
-        self.start_playback() # Restart normally
+        if _HAS_RECORD_API:
+            self.player.record(False, None)
+        else:
+            # Restart playback without recording
+            self.player.stop()
+            self.start_playback() # Restart normally
         self.status_label.setText(f"Recording saved to Music folder")
 
+    def _on_playing(self):
+        """Handles VLC entering the Playing state."""
+        # Ignore a Playing event queued before the user stopped the stream
+        if not self.player.is_playing():
+            return
+        if not self.is_recording:
+            self.status_label.setText("Playing")
+        self.play_pause_button.setText("❚❚")
+        self.update_ui()
+
+    def _on_paused(self):
+        """Handles VLC pausing the stream."""
+        self.status_label.setText("Paused")
+
+    def _on_error(self):
+        """Handles a stream that VLC failed to open or lost."""
+        self._reset_after_stream_loss("Stream error")
+
+    def _on_ended(self):
+        """Handles a stream that ended or was dropped by the server."""
+        self._reset_after_stream_loss("Stream ended")
+
+    def _reset_after_stream_loss(self, status):
+        """Resets the UI, and any recording, after VLC stops the stream on its own."""
+        if self.is_recording:
+            # The stream is gone, so there is nothing to restart
+            self.is_recording = False
+            self._set_record_button_state(False)
+            self.record_button.setToolTip("Record")
+        self.play_pause_button.setText("▶")
+        self.station_label.setText("Welcome to PyRadio")
+        self.track_label.setText("Select a station to begin")
+        self.status_label.setText(status)
+        self._last_meta = None
+        self._meta_dirty = True
+
+    def _on_meta_changed(self):
+        """Handles VLC reporting new metadata for the current media."""
+        self._meta_dirty = True
+        self.update_ui()
+
+    def _set_record_button_state(self, recording):
+        """Flips the record button's "recording" style without re-parsing CSS."""
+        self.record_button.setProperty("recording", recording)
+        self.record_button.style().unpolish(self.record_button)
+        self.record_button.style().polish(self.record_button)
+
     def update_ui(self):
-        """Periodically updates the UI, especially track metadata."""
-        if self.player.get_state() == vlc.State.Playing:
-             if not self.is_recording:
-                self.status_label.setText("Playing")
-        
-        media = self.player.get_media()
+        """Updates the track metadata shown for the current stream."""
+        if not self._meta_dirty:
+            return
+        media = self._current_media
         if media:
-            metadata = media.get_meta(vlc.Meta.NowPlaying)
-            if metadata:
+            self._meta_dirty = False
+            metadata = media.get_meta(vlc.Meta.NowPlaying) or "..."
+            if metadata != self._last_meta:
                 self.track_label.setText(metadata)
-            else:
-                self.track_label.setText("...")
+                self._last_meta = metadata
 
     def closeEvent(self, event):
         """Ensures the player is stopped on application exit."""
         self.stop_playback()
+        # Builds still queued would otherwise arrive after VLC is released
+        self._media_builder.ready.disconnect(self._apply_media)
+        self._media_thread.quit()
+        self._media_thread.wait()
+        # Preloads queued before the pool drains must not outlive the instance
+        self.media_preloaded.disconnect(self._on_media_preloaded)
+        self._preload_pool.waitForDone()
+        self._release_preloaded_media()
         self.player.release()
+        if self._current_media is not None:
+            self._current_media.release()
         self.instance.release()
         event.accept()
 
-    def _get_music_folder(self):
-        """Returns the default Music folder path for the current OS."""
-        return os.path.join(os.path.expanduser('~'), 'Music')
+    @cached_property
+    def music_folder(self):
+        """The Music folder recordings are saved to, created on first use."""
+        music_dir = Path.home() / "Music"
+        music_dir.mkdir(parents=True, exist_ok=True)
+        return music_dir
+
+    def _new_record_path(self):
+        """Returns a timestamped MP3 path in the Music folder for the current station."""
+        sanitized_name = _SANITIZED_NAMES[self.current_station_name]
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        return str(self.music_folder / f"rec_{sanitized_name}_{timestamp}.mp3")
 
     def _get_app_icon(self):
+        """Returns the application QIcon, building it on first use."""
+        if RadioApp._APP_ICON is None:
+            RadioApp._APP_ICON = self._build_app_icon()
+        return RadioApp._APP_ICON
+
+    def _build_app_icon(self):
         """Creates a simple QIcon for the application."""
         # Using a unicode character as a fallback icon
         from PyQt6.QtGui import QPixmap, QPainter, QColor
@@ -333,106 +703,25 @@ class RadioApp(QMainWindow):
 
     def _apply_stylesheet(self):
         """Applies a Winamp-inspired stylesheet to the application."""
-        # A custom font for the "digital" display
-        font_id = QFontDatabase.addApplicationFontFromData(self._get_font_data())
-        if font_id == -1:
-            print("Failed to load custom font.")
-            font_family = "Courier New"
-        else:
-            font_families = QFontDatabase.applicationFontFamilies(font_id)
-            if font_families:
-                font_family = font_families[0]
+        # A custom font for the "digital" display, registered once per process
+        global _FONT_FAMILY
+        if _FONT_FAMILY is None:
+            font_id = QFontDatabase.addApplicationFontFromData(_FONT_BYTES)
+            if font_id == -1:
+                print("Failed to load custom font.")
+                _FONT_FAMILY = "Courier New"
             else:
-                print("Failed to get font family from loaded font.")
-                font_family = "Courier New"
-
-        self.setStyleSheet(f"""
-            QMainWindow {{
-                background-color: #333333;
-            }}
-            QFrame#displayFrame {{
-                background-color: #111;
-                border: 2px solid #555;
-                border-radius: 5px;
-                margin: 10px;
-            }}
-            QLabel#stationLabel, QLabel#trackLabel, QLabel#statusLabel {{
-                color: #00FF00; /* Bright green */
-                font-family: "{font_family}", "Courier New", monospace;
-                font-size: 14px;
-                font-weight: bold;
-            }}
-             QLabel#trackLabel {{
-                font-size: 16px;
-                min-height: 40px; /* Allow for two lines */
-            }}
-            QLabel#statusLabel {{
-                color: #FFFF00; /* Yellow */
-                font-size: 12px;
-            }}
-            QFrame#controlsFrame, QFrame#playlistFrame {{
-                background-color: #444;
-                border-top: 1px solid #666;
-            }}
-            QFrame#playlistFrame {{
-                padding: 10px;
-            }}
-            QPushButton#controlButton {{
-                background-color: #666;
-                color: #EEE;
-                border: 1px solid #888;
-                border-radius: 20px; /* Circular buttons */
-                font-size: 20px;
-                font-weight: bold;
-            }}
-            QPushButton#controlButton:hover {{
-                background-color: #777;
-            }}
-            QPushButton#controlButton:pressed {{
-                background-color: #555;
-            }}
-            QPushButton#recordButton {{
-                color: #e74c3c;
-            }}
-            QSlider::groove:horizontal {{
-                border: 1px solid #555;
-                height: 8px;
-                background: #333;
-                margin: 2px 0;
-                border-radius: 4px;
-            }}
-            QSlider::handle:horizontal {{
-                background: #999;
-                border: 1px solid #777;
-                width: 18px;
-                margin: -5px 0;
-                border-radius: 9px;
-            }}
-            QComboBox, QListWidget {{
-                background-color: #222;
-                color: #DDD;
-                border: 1px solid #555;
-                padding: 5px;
-                border-radius: 3px;
-            }}
-            QComboBox::drop-down {{
-                border: none;
-            }}
-            QListWidget::item:hover {{
-                background-color: #3e5a30; /* Dark green selection */
-            }}
-            QListWidget::item:selected {{
-                background-color: #5c8a48; /* Lighter green selection */
-            }}
-        """)
-        
-    def _get_font_data(self):
-        """Returns the raw data for a retro digital font (base64 encoded)."""
-        # This avoids needing a separate font file.
-        # Digital-7 (Mono) by Sizenko Alexander
-        # http://www.styleseven.com
-        import base64
-        return base64.b64decode(b'AAEAAAALAIAAAwAwT1MvMggi/dUAAAC8AAAAYGNtYXABDQDNAAACNAAAAGxnYXNwAAAAEAAAAugAAAAIZ2x5ZgscV9gAAALwAAABHGhlYWQG41YJAAABMAAAADZoaGVhA+IB6QAAAVQAAAAkaG10eAoAAEAAAAABZAAAACRsb2NhAKgDNQAAAnQAAAAMbWF4cAAUANQAAAFoAAAAIG5hbWU9wjpWAAAC7AAAAlBwb3N0/5QA3gAAAXgAAAAgAAEAAAABAAAAAAAAAAMAAAADAAAAHAABAAAAAABMAAQAAQAAAAAAAgAAAAAAAQAAAAMAAwAAAAsAAABMAQUAAQAAABoABAAQAAAAEABIAAIAAAAEACIAAQAAAAQAIAAFAAEAAAABAAYABgABAAAAAAEAIAAHAAEAAAABAAgACAABAAAAAAEAJAABAAEAAAAFAAEAEgABAAAABAACABAAAgAAAAMARABpAGcAaQB0AGEAbAAtADcAIABNAG8AbgBvAAAAUgBlAGcAdQBsAGEAcgAAAEQAaQBnAGkAdABhAGwALQA3ACAATQBvAG4AbwAAAAAA')
+                font_families = QFontDatabase.applicationFontFamilies(font_id)
+                if font_families:
+                    _FONT_FAMILY = font_families[0]
+                else:
+                    print("Failed to get font family from loaded font.")
+                    _FONT_FAMILY = "Courier New"
+        font_family = _FONT_FAMILY
+
+        if RadioApp._STYLESHEET_CACHE is None:
+            RadioApp._STYLESHEET_CACHE = _STYLESHEET_TEMPLATE.format(font_family=font_family)
+        self.setStyleSheet(RadioApp._STYLESHEET_CACHE)
 
 
 if __name__ == '__main__':